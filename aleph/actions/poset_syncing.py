@@ -23,6 +23,7 @@ from aleph.data_structures import pretty_hash
 def poset_info(poset):
     '''
     A short representation of the poset state, for syncing purposes.
+    The result is cached in the poset until a new unit is added, so it is shared between syncs and must not be modified.
 
     :param Poset poset: the poset which state we want to receive
     :returns: A list of lists of pairs (height, hash), with the heights and hashes of maximal elements per process in the poset.
@@ -31,7 +32,9 @@ def poset_info(poset):
     def to_sync_repr(units):
         return [(U.height, U.hash()) for U in units]
 
-    return [to_sync_repr(units) for units in poset.max_units_per_process]
+    if poset.sync_info is None:
+        poset.sync_info = [to_sync_repr(units) for units in poset.max_units_per_process]
+    return poset.sync_info
 
 
 def order_units_topologically(units_list):
@@ -82,7 +85,7 @@ def units_to_send_with_pid(poset, tops, pid):
     local_max = poset.max_units_per_process[pid]
     local_max.sort(key=lambda U: U.height)
     min_remote_height = min([t[0] for t in tops]) if len(tops) > 0 else -1
-    remote_hashes = [t[1] for t in tops]
+    remote_hashes = set(t[1] for t in tops)
 
     for U in local_max:
         possibly_send = []
@@ -92,7 +95,7 @@ def units_to_send_with_pid(poset, tops, pid):
         if U is None or U.hash() in remote_hashes:
             to_send.extend(possibly_send)
 
-    return to_send, [h for h in remote_hashes if h not in poset.units]
+    return to_send, [t[1] for t in tops if t[1] not in poset.units]
 
 
 def _drop_to_height(units, height):
@@ -158,7 +161,7 @@ def units_to_send(poset, info, requests=None):
         pid_to_send, pid_my_requests = units_to_send_with_pid(poset, info[pid], pid)
         to_send.extend(pid_to_send)
         my_requests.append(pid_my_requests)
-        hashes_to_send = [U.hash() for U in pid_to_send]
+        hashes_to_send = set(U.hash() for U in pid_to_send)
         unfulfilled_requests = [h for h in requests[pid] if h not in hashes_to_send]
         to_send.extend(requested_units_to_send(poset, info[pid], unfulfilled_requests))
 
@@ -173,12 +176,15 @@ def dehash_parents(poset, U):
     :param Unit U: the unit with hashes instead of parents
     '''
 
-    if not all(p in poset.units for p in U.parents):
-        strangers = [pretty_hash(parent_hash) for parent_hash in U.parents if parent_hash not in poset.units]
+    units = poset.units
+    try:
+        parents = [units[p] for p in U.parents]
+    except KeyError:
+        strangers = [pretty_hash(parent_hash) for parent_hash in U.parents if parent_hash not in units]
         logger = logging.getLogger(consts.LOGGER_NAME)
         logger.error(f'dehash_parents {poset.process_id} | Parents {strangers} not found in the poset for {U.short_name()}')
 
         assert False, 'Attempting to fix parents but parents not present in poset'
 
-    U.parents = [poset.units[p] for p in U.parents]
+    U.parents = parents
     U.height = U.parents[0].height+1 if U.parents else 0
@@ -14,7 +14,7 @@
 import aleph.const as consts
 
 import charm.toolbox.pairinggroup
-PAIRING_GROUP = charm.toolbox.pairinggroup.PairingGroup('MNT224')
+PAIRING_GROUP = charm.toolbox.pairinggroup.PairingGroup(consts.PAIRING_CURVE)
 # initialize group generator
 GENERATOR = PAIRING_GROUP.hash('gengen', charm.toolbox.pairinggroup.G2)
 # precompute exponentiation table to speed up computations
@@ -21,6 +21,7 @@ SYNC_INIT_DELAY       = 0.015625            # delay after initianing a sync with
 
 N_RECV_SYNC           = 10                  # number of allowed parallel received syncs
 N_INIT_SYNC           = 10                  # number of allowed parallel initiated syncs
+UNITS_ZLIB_LEVEL      = 1                   # zlib compression level (0-9) of batches of units sent during syncs
 
 TXPU                  = 1                   # number of transactions per unit
 TX_LIMIT              = 1000000             # limit of all txs generated for one process
@@ -32,6 +33,7 @@ SYNCS_LIMIT           = None                # maximal number of syncs that are p
 USE_TCOIN             = 1                   # whether to use threshold coin
 PRECOMPUTE_POPULARITY = 0                   # precompute popularity proof to ease computational load of Poset.compute_vote procedure
 ADAPTIVE_DELAY        = 1                   # whether to use the adaptive strategy of determining create_delay
+PAIRING_CURVE         = 'MNT224'            # curve of the pairing group used by threshold signatures, one of the curves shipped with charm
 
 VOTING_LEVEL          = 3                   # level at which the first voting round occurs, this is "t" from the write-up
 PI_DELTA_LEVEL        = 12                  # level at which to switch from the "fast" to the pi_delta algorithm
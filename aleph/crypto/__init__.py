@@ -12,7 +12,7 @@
 '''
 
 from .crp import CommonRandomPermutation
-from .byte_utils import xor, sha3_hash, extract_bit
+from .byte_utils import xor, sha3_hash, blake2b_hash, extract_bit
 from .keys import SigningKey, VerifyKey
 from .threshold_coin import ThresholdCoin
 from .threshold_signatures import generate_keys, SecretKey, VerificationKey
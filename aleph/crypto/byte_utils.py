@@ -41,6 +41,15 @@ def sha3_hash(bytestring):
     return hashlib.sha3_256(bytestring).digest()
 
 
+def blake2b_hash(bytestring):
+    '''
+    Returns the 32-byte blake2b hash of the bytestring.
+
+    :param bytes bytestring: bytestring of which the hash is calculated.
+    '''
+    return hashlib.blake2b(bytestring, digest_size=32).digest()
+
+
 def xor(bytes1, bytes2):
     '''
     Returns a xor of two bytestrings bytes1, bytes2. The length of the result is the max of their lengths.
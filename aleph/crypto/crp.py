@@ -29,6 +29,11 @@ class CommonRandomPermutation:
         self.cache = {}
         self.cache_size = 20
 
+        # the xor of all public keys does not depend on the level, so it is computed only once
+        self.xor_all = bytes([0])
+        for pk in self.public_keys_hex:
+            self.xor_all = xor(self.xor_all, pk)
+
     def _hash(self, bytestring):
         if self.hashing_function is None:
             return sha3_hash(bytestring)
@@ -69,12 +74,8 @@ class CommonRandomPermutation:
         if level in self.cache:
             return self.cache[level]
 
-        xor_all = bytes([0])
-        for pk in self.public_keys_hex:
-            xor_all = xor(xor_all, pk)
-
         seeds = [self._hash(pk + (str(level).encode())) for pk in self.public_keys_hex]
-        seeds = [xor(xor_all, x) for x in seeds]
+        seeds = [xor(self.xor_all, x) for x in seeds]
 
         indexed_seeds = zip(seeds, range(len(seeds)))
         indexed_seeds = sorted(list(indexed_seeds))
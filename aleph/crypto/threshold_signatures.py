@@ -11,7 +11,7 @@
     along with this program. If not, see <http://www.gnu.org/licenses/>.
 '''
 
-from functools import reduce
+from functools import lru_cache, reduce
 
 from charm.toolbox.pairinggroup import ZR, G1, pair
 
@@ -76,7 +76,7 @@ class VerificationKey:
         :returns: element of G1 group
         '''
 
-        return self.group.hash(msg, G1)
+        return _hash_to_G1(msg)
 
     def lagrange(self, S, i):
         '''
@@ -86,12 +86,17 @@ class VerificationKey:
         :param int i: special value for denumerator
         '''
 
-        one = self.group.init(ZR, 1)
-        S = sorted(S)
-        num = reduce(lambda x, y: x*y, [0 - j - 1 for j in S if j != i], one)
-        den = reduce(lambda x, y: x*y, [i - j     for j in S if j != i], one)
+        return _lagrange(S, i)
 
-        return num/den
+    def lagrange_coefs(self, S):
+        '''
+        Lagrange coefficients of all the indices in S. They do not depend on the key and are cached for recently used sets of indices.
+
+        :param list S: indices of parties whose shares are combined
+        :returns: dictionary mapping every index in S to its Lagrange coefficient
+        '''
+
+        return _lagrange_coefs(tuple(sorted(S)))
 
     def verify_share(self, share, i, msg_hash):
         '''
@@ -103,6 +108,20 @@ class VerificationKey:
         '''
         return pair(share, self.gen) == pair(msg_hash, self.vks[i])
 
+    def batch_verify_shares(self, shares, msg_hash):
+        '''
+        Verifies at once if all the shares of a signature of the same message are valid, using two pairings instead of two per share.
+        Every share is raised to a random exponent, so that invalid shares cannot cancel each other out.
+
+        :param dict shares: keys are indices of parties, values are their shares of a signature of msg_hash
+        :param int msg_hash: hash of a message that is signed
+        '''
+        assert shares, 'No shares to verify'
+        exps = {i: self.group.random(ZR) for i in shares}
+        share_prod = reduce(lambda x, y: x*y, [share ** exps[i] for i, share in shares.items()])
+        vk_prod = reduce(lambda x, y: x*y, [self.vks[i] ** exps[i] for i in shares])
+        return pair(share_prod, self.gen) == pair(msg_hash, vk_prod)
+
     def verify_signature(self, signature, msg_hash):
         '''
         Verifies if signature is valid.
@@ -119,8 +138,8 @@ class VerificationKey:
         :param dict shares: shares of a signature to be produced
         '''
         assert len(shares) == self.threshold
-        R = shares.keys()
-        return reduce(lambda x,y: x*y, [share ** self.lagrange(R, i) for i, share in shares.items()], 1)
+        coefs = self.lagrange_coefs(shares.keys())
+        return reduce(lambda x,y: x*y, [share ** coefs[i] for i, share in shares.items()], 1)
 
     def hash_msg(self, msg):
         '''
@@ -150,6 +169,33 @@ class SecretKey:
         '''
         return msg_hash ** self.sk
 
+@lru_cache(maxsize=4096)
+def _lagrange_coefs(S):
+    '''
+    Lagrange coefficients of all the indices in S. The returned dictionary is shared between calls and must not be modified.
+
+    :param tuple S: sorted indices of parties whose shares are combined
+    '''
+    return {i: _lagrange(S, i) for i in S}
+
+def _lagrange(S, i):
+    one = PAIRING_GROUP.init(ZR, 1)
+    S = sorted(S)
+    num = reduce(lambda x, y: x*y, [0 - j - 1 for j in S if j != i], one)
+    den = reduce(lambda x, y: x*y, [i - j     for j in S if j != i], one)
+
+    return num/den
+
+@lru_cache(maxsize=256)
+def _hash_to_G1(msg):
+    '''
+    Hashes a message into group G1. The result does not depend on the keys, and the same messages (nonces of coin tosses) are
+    hashed over and over when creating, verifying and combining coin shares of all the dealers, hence it is cached.
+
+    :param string msg: message to be hashed
+    '''
+    return PAIRING_GROUP.hash(msg, G1)
+
 def _poly(coefs, x):
     '''
     Evaluates a polynomial given by coefficients at some point.
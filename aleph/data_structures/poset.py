@@ -49,6 +49,8 @@ class Poset:
         # the list of globally maximal units in the poset -- sorted from the least recent to most recent
         self.max_units = []
         self.forking_height = [float('inf')] * n_processes
+        # the short representation of max_units_per_process used for syncing (see poset_info), reset whenever a unit is added
+        self.sync_info = None
 
         #common random permutation
         self.crp = crp
@@ -57,6 +59,8 @@ class Poset:
         self.level_timing_established = 0
         # threshold coins dealt, this is a dictionary {Unit_hash -> ThresholdCoin} where keys are hashes of dealing units
         self.threshold_coins = {}
+        # results of validate_share, a dictionary {Unit_hash -> bool}; the same shares are validated in every toss at their level
+        self.validated_shares = {}
 
         self.prime_units_by_level = {}
 
@@ -115,6 +119,7 @@ class Poset:
         self.level_reached = max(self.level_reached, U.level)
         self.units[U.hash()] = U
         self.units_as_added.append(U)
+        self.sync_info = None
 
         # 1. if it is a dealing unit, add it to self.dealing_units
         if not U.parents and not U in self.dealing_units[U.creator_id]:
@@ -220,7 +225,7 @@ class Poset:
 
         :param int level: the requested level of units
         '''
-        if level not in self.prime_units_by_level.keys():
+        if level not in self.prime_units_by_level:
             return []
         return [V for Vs in self.prime_units_by_level[level] for V in Vs]
 
@@ -240,7 +245,7 @@ class Poset:
         Returns a list of all prime units at a given level divided by process. For nonforking processes this should be a list of one-elements lists.
         :param int level: the requested level of units
         '''
-        assert level in self.prime_units_by_level.keys()
+        assert level in self.prime_units_by_level
         return self.prime_units_by_level[level]
 
 
@@ -379,6 +384,9 @@ class Poset:
 
         prime_below_parents = set(self.get_prime_units_at_level_below_unit(level, U.self_predecessor))
         for V in U.parents[1:]:
+            # no prime unit of a level higher than V's can be below V, so there is no need to look for them
+            if V.level < level:
+                return False
             # if the level of V is higher, accept it and check everything from here at that level
             if V.level > level:
                 level = V.level
@@ -426,8 +434,9 @@ class Poset:
         :returns: Boolean value, True if U satisfies the above conditions, False otherwise.
         '''
         # 0. Parents of U exist in the poset
+        units = self.units
         for V in U.parents:
-            if V.hash() not in self.units.keys():
+            if V.hash() not in units:
                 return False
 
         # 1. The first parent was created by U's creator and has one less height than U.
@@ -732,7 +741,7 @@ class Poset:
         if U_c_hash not in self.timing_partial_results:
             self.timing_partial_results[U_c_hash] = {}
         memo = self.timing_partial_results[U_c_hash]
-        if 'decision' in memo.keys():
+        if 'decision' in memo:
             return memo['decision']
 
         t = consts.VOTING_LEVEL
@@ -988,9 +997,13 @@ class Poset:
         :param Unit U: the unit whose coin shares are being checked
         :returns: True if the coin share is verified successfully, False otherwise
         '''
-        U_dealing = self.first_dealing_unit(U)
-        coin_share = U.coin_shares[0]
-        return self.threshold_coins[U_dealing.hash()].verify_coin_share(coin_share, U.creator_id, U.level)
+        # verifying a share takes two pairings, and the result depends only on U, so it is memoized
+        U_hash = U.hash()
+        if U_hash not in self.validated_shares:
+            U_dealing = self.first_dealing_unit(U)
+            coin_share = U.coin_shares[0]
+            self.validated_shares[U_hash] = self.threshold_coins[U_dealing.hash()].verify_coin_share(coin_share, U.creator_id, U.level)
+        return self.validated_shares[U_hash]
 
 
     def toss_coin(self, U_c, U_tossing):
@@ -12,7 +12,7 @@
 '''
 
 '''This module implements unit - a basic building block of Aleph protocol.'''
-from aleph.crypto import sha3_hash
+from aleph.crypto import blake2b_hash
 import pickle
 import zlib
 import base64
@@ -30,7 +30,7 @@ class Unit(object):
     :param list coin_shares: list of coin_shares if this is a prime unit, None otherwise
     '''
 
-    __slots__ = ['creator_id', 'parents', 'txs', 'signature', '_coin_shares',
+    __slots__ = ['creator_id', 'parents', 'txs', 'signature', '_coin_shares', '_serialized_coin_shares',
                  'level', 'floor', 'height', 'hash_value', 'n_txs']
 
     def __init__(self, creator_id, parents, txs, signature=None, coin_shares=None):
@@ -38,9 +38,10 @@ class Unit(object):
         self.parents = parents
         self.signature = signature
         self._coin_shares = coin_shares or []
+        self._serialized_coin_shares = None
         self.level = None
         self.hash_value = None
-        self.txs = zlib.compress(pickle.dumps(txs), level=4)
+        self.txs = _serialize_txs(txs) if txs else _SERIALIZED_NO_TXS
         self.n_txs = len(txs)
         self.height = parents[0].height+1 if len(parents) > 0 else 0
 
@@ -58,9 +59,17 @@ class Unit(object):
     @coin_shares.setter
     def coin_shares(self, value):
         self._coin_shares = value
+        self._serialized_coin_shares = None
         self.hash_value = None
 
 
+    def serialized_coin_shares(self):
+        '''Returns the coin shares serialized to bytestrings. The result is cached, as serializing group elements is costly.'''
+        if self._serialized_coin_shares is None:
+            self._serialized_coin_shares = _serialize_coin_shares(self.coin_shares)
+        return self._serialized_coin_shares
+
+
     def transactions(self):
         '''Returns the list of transactions contained in the unit.'''
         return list(pickle.loads(zlib.decompress(self.txs)))
@@ -73,7 +82,7 @@ class Unit(object):
     def bytestring(self):
         '''Create a bytestring with all essential info about this unit for the purpose of signature creation and checking.'''
         creator = str(self.creator_id).encode()
-        serialized_shares = _serialize_and_flatten_coin_shares(self.coin_shares)
+        serialized_shares = _flatten_serialized_coin_shares(self.serialized_coin_shares())
         return b'|'.join([creator] + self.parents_hashes() + serialized_shares + [self.txs])
 
 
@@ -87,13 +96,14 @@ class Unit(object):
 
 
     def __getstate__(self):
-        serialized_coin_shares = _serialize_coin_shares(self.coin_shares)
-        return (self.creator_id, self.parents_hashes(), self.txs, self.n_txs, self.signature, serialized_coin_shares)
+        return (self.creator_id, self.parents_hashes(), self.txs, self.n_txs, self.signature, self.serialized_coin_shares())
 
 
     def __setstate__(self, state):
         self.creator_id, self.parents, self.txs, self.n_txs, self.signature, serialized_coin_shares = state
         self.coin_shares = _deserialize_coin_shares(serialized_coin_shares)
+        # we already have the serialized form at hand, no need to recompute it later
+        self._serialized_coin_shares = serialized_coin_shares
         self.level = None
         self.hash_value = None
 
@@ -102,7 +112,7 @@ class Unit(object):
         '''Returns the value of hash of this unit.'''
         if self.hash_value is not None:
             return self.hash_value
-        self.hash_value = sha3_hash(self.bytestring())
+        self.hash_value = blake2b_hash(self.bytestring())
         return self.hash_value
 
 
@@ -161,12 +171,18 @@ def _deserialize_coin_shares(serialized_shares):
         return [PAIRING_GROUP.deserialize(cs, compression = False) for cs in serialized_shares]
 
 
-def _serialize_and_flatten_coin_shares(coin_shares):
-    '''Return a list of bytestrings as a representation of coin shares.'''
-    if isinstance(coin_shares,dict):
+def _flatten_serialized_coin_shares(serialized_shares):
+    '''Return a list of bytestrings as a representation of (already serialized) coin shares.'''
+    if isinstance(serialized_shares, dict):
         # we need to transform a dict of bytestrings into a list of bytestrings
-        serialized_shares = _serialize_coin_shares(coin_shares)
         return serialized_shares['sks'] + serialized_shares['vks'] + [serialized_shares['vk']]
     else:
         # already in the right format
-        return _serialize_coin_shares(coin_shares)
+        return serialized_shares
+
+
+def _serialize_txs(txs):
+    return zlib.compress(pickle.dumps(txs), level=4)
+
+# many units carry no transactions, there is no need to serialize the empty list for each of them
+_SERIALIZED_NO_TXS = _serialize_txs([])
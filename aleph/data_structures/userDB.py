@@ -23,13 +23,30 @@ class UserDB:
     def __init__(self, initial_balances_and_indices = []):
         '''
         Creates a user data base that contains user balances (by public key) and their last validated transaction.
+        Every user is given a position in the data base, balances and indices of last transactions are stored in two lists
+        at that position, so that a single lookup of a public key gives access to both.
         :param list initial_balances_and_indices: a list of triples consisting of a user's public key, their intial balance and the index of the last transaction performed by them
         '''
-        self.user_balance = {}
-        self.user_last_transaction_index = {}
+        self.index = {}
+        self.balances = []
+        self.last_transaction_indices = []
         for public_key, balance, index in initial_balances_and_indices:
-            self.user_balance[public_key] = balance
-            self.user_last_transaction_index[public_key] = index
+            i = self._user_index(public_key)
+            self.balances[i] = balance
+            self.last_transaction_indices[i] = index
+
+
+    def _user_index(self, user_public_key):
+        '''
+        Get the position of the given user in the data base, adding them with an empty account if they are not present yet.
+        :param str user_public_key: the public key of the user
+        '''
+        i = self.index.get(user_public_key)
+        if i is None:
+            i = self.index[user_public_key] = len(self.balances)
+            self.balances.append(0)
+            self.last_transaction_indices.append(-1)
+        return i
 
 
     def account_balance(self, user_public_key):
@@ -37,7 +54,8 @@ class UserDB:
         Get the balance of the given user.
         :param str user_public_key: the public key of the user
         '''
-        return self.user_balance.get(user_public_key, 0)
+        i = self.index.get(user_public_key)
+        return 0 if i is None else self.balances[i]
 
 
     def last_transaction(self, user_public_key):
@@ -45,7 +63,8 @@ class UserDB:
         Get the index of the last transaction issued by the given user.
         :param str user_public_key: the public key of the user
         '''
-        return self.user_last_transaction_index.get(user_public_key, -1)
+        i = self.index.get(user_public_key)
+        return -1 if i is None else self.last_transaction_indices[i]
 
 
     def check_transaction_correctness(self, tx):
@@ -54,9 +73,10 @@ class UserDB:
         :param Tx tx: the transaction to check
         :returns: True if the transaction has index one higher than the last transaction made by its issuer and the balance allows for the transaction, False otherwise
         '''
-        issuer_balance = self.user_balance.get(tx.issuer, 0)
-        issuer_last_transaction = self.user_last_transaction_index.get(tx.issuer, -1)
-        return tx.amount >= 0 and issuer_balance >= tx.amount and tx.index == issuer_last_transaction + 1
+        i = self.index.get(tx.issuer)
+        if i is None:
+            return tx.amount == 0 and tx.index == 0
+        return tx.amount >= 0 and self.balances[i] >= tx.amount and tx.index == self.last_transaction_indices[i] + 1
 
 
     def apply_transaction(self, tx):
@@ -65,7 +85,7 @@ class UserDB:
         :param Tx tx: the transaction to perform
         '''
         if self.check_transaction_correctness(tx):
-            self.user_balance[tx.issuer] -= tx.amount
-            self.user_balance[tx.receiver] += tx.amount
-            self.user_last_transaction_index[tx.issuer] += 1
-
+            i, j = self._user_index(tx.issuer), self._user_index(tx.receiver)
+            self.balances[i] -= tx.amount
+            self.balances[j] += tx.amount
+            self.last_transaction_indices[i] += 1
@@ -23,6 +23,7 @@ from aleph.crypto.keys import SigningKey, VerifyKey
 from aleph.data_structures import UserDB, Tx
 from aleph.network import tx_listener, tx_source_gen
 from aleph.process import Process
+from aleph.utils import install_uvloop
 
 import aleph.const as consts
 
@@ -101,4 +102,5 @@ async def main():
 
 
 if __name__ == '__main__':
+    install_uvloop()
     asyncio.run(main())
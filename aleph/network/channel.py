@@ -13,6 +13,7 @@
 
 import asyncio
 import logging
+import socket
 
 import aleph.const as consts
 
@@ -32,7 +33,10 @@ class Channel:
 
     '''
 
-    REJECT = b'REJECT'
+    # every message is preceded by its length written as a fixed-width big-endian integer; the largest value is reserved
+    # for REJECT messages
+    HEADER_SIZE = 4
+    REJECT = b'\xff' * HEADER_SIZE
 
     def __init__(self, owner_id, peer_id, peer_address):
         self.owner_id = owner_id
@@ -42,26 +46,42 @@ class Channel:
         self.in_use = asyncio.Lock()
         self.reader = None
         self.writer = None
+        # data written with flush=False, waiting to be sent together with the next flushed write
+        self.out_buffer = bytearray()
 
     @staticmethod
     async def receive_handshake(reader, writer):
         '''Receive handshake from an unknown process and find out their process_id.'''
 
         data = await reader.readuntil()
-        return int(data.rstrip(b'\n'))
+        # int() accepts bytes and ignores the trailing newline, no need to strip it
+        return int(data)
 
     def send_handshake(self):
-        '''Introduce yourself (send process_id) to newly connected process.'''
+        '''Introduce yourself (send process_id) to newly connected process. The handshake goes out with the next flushed write.'''
 
-        self.writer.write(f'{self.owner_id}\n'.encode())
+        self.out_buffer += f'{self.owner_id}\n'.encode()
 
     def connect(self, reader, writer):
         '''Activate channel by connecting existing reader and writer to it.'''
 
         self.reader = reader
         self.writer = writer
+        self.configure_socket()
         self.active.set()
 
+    def configure_socket(self):
+        '''
+        Tune the underlying socket for the sync protocol: disable Nagle's algorithm, so that short messages (handshakes,
+        poset info, requests) are not delayed, and set the high-water mark of the transport's buffer to 0, so that
+        drain() waits until the data is actually passed to the socket.
+        '''
+
+        sock = self.writer.get_extra_info('socket')
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.writer.transport.set_write_buffer_limits(high=0)
+
     def is_active(self):
         '''Guess what...'''
 
@@ -71,9 +91,8 @@ class Channel:
         '''Send REJECT message.'''
 
         if self.is_active():
-            self.writer.write(self.REJECT)
-            self.writer.write(b'\n')
-            await self.writer.drain()
+            self.out_buffer += self.REJECT
+            await self.flush()
 
     async def read(self):
         '''
@@ -84,24 +103,37 @@ class Channel:
 
         await self.active.wait()
 
-        data = await self.reader.readuntil()
-        data = data.rstrip(b'\n')
-        if data == self.REJECT:
+        header = await self.reader.readexactly(self.HEADER_SIZE)
+        if header == self.REJECT:
             raise RejectException()
-        n_bytes = int(data)
-        data = await self.reader.readexactly(n_bytes)
-        return data
+        n_bytes = int.from_bytes(header, 'big')
+        # readexactly hands over the payload as one bytes object cut straight out of the stream buffer
+        return await self.reader.readexactly(n_bytes)
 
-    async def write(self, data):
-        '''Send data through the channel.'''
+    async def write(self, data, flush=True):
+        '''
+        Send data through the channel.
+        If flush is False, the data is only buffered and sent together with the next flushed write. This is meant for
+        consecutive messages of one phase of a sync, so that they end up in a single transport write.
+        '''
 
         if not self.is_active():
             await self.open()
 
-        self.writer.write(str(len(data)).encode())
-        self.writer.write(b'\n')
-        self.writer.write(data)
-        await self.writer.drain()
+        assert len(data) < 256**self.HEADER_SIZE - 1, 'Message too long to be sent through the channel'
+        self.out_buffer += len(data).to_bytes(self.HEADER_SIZE, 'big')
+        self.out_buffer += data
+        if flush:
+            await self.flush()
+
+    async def flush(self):
+        '''Send all the buffered data through the channel.'''
+
+        if self.out_buffer:
+            # the transport may keep a view of the written buffer, hence we start a new one instead of clearing it
+            self.writer.write(self.out_buffer)
+            self.out_buffer = bytearray()
+            await self.writer.drain()
 
     async def open(self):
         '''Activate the channel by opening a new connection to the peer.'''
@@ -119,6 +151,7 @@ class Channel:
 
         logger.info(f'sync_open_chan {self.owner_id} | Opening connection to {self.peer_id} - succeded')
 
+        self.configure_socket()
         self.send_handshake()
         self.active.set()
 
@@ -129,4 +162,5 @@ class Channel:
             self.writer.close()
             await self.writer.wait_closed()
             self.reader, self.writer = None, None
+            self.out_buffer = bytearray()
             self.active.clear()
@@ -12,8 +12,10 @@
 '''
 
 import asyncio
+import functools
 import pickle
 import socket
+import zlib
 
 from .channel import Channel, RejectException
 from aleph.utils import timer
@@ -22,6 +24,15 @@ from aleph.data_structures import pretty_hash
 import aleph.const as consts
 
 
+@functools.lru_cache(maxsize=None)
+def _host_ip():
+    '''
+    The address the sync servers are started on. The name lookup blocks the event loop and all processes running in one Python
+    process get the same answer, hence it is done only once.
+    '''
+    return socket.gethostbyname(socket.gethostname())
+
+
 class Network:
     ''' Class that takes care of handling network connections with other processes.
 
@@ -71,7 +82,7 @@ class Network:
             channel.connect(reader, writer)
             self.logger.info(f'channel_handler {self.process.process_id} | Opened channel with {peer_id}')
 
-        host_ip = socket.gethostbyname(socket.gethostname())
+        host_ip = _host_ip()
         host_port = self.addresses[self.process.process_id][1]
         server = await asyncio.start_server(channel_handler, host_ip, host_port)
         server_started.set()
@@ -98,12 +109,12 @@ class Network:
         if not self.keep_connection:
             await channel.close()
 
-    async def _send_poset_info(self, channel, mode, ids):
+    async def _send_poset_info(self, channel, mode, ids, flush=True):
         self.logger.info(f'send_poset_{mode} {ids} | sending info about heights to {channel.peer_id}')
         to_send = poset_info(self.process.poset)
         data = pickle.dumps(to_send)
         self.logger.info(f'send_poset_wait_{mode} {ids} | writing info about heights to {channel.peer_id}')
-        await channel.write(data)
+        await channel.write(data, flush)
         printable_heights = [[(h, pretty_hash(H)) for (h, H) in local_info] for local_info in to_send]
         self.logger.info(f'send_poset_done_{mode} {ids} | sent heights {printable_heights} ({len(data)} bytes) '
                          f'to {channel.peer_id}')
@@ -137,14 +148,14 @@ class Network:
                          f'from {channel.peer_id}')
         return requests_received
 
-    async def _send_units(self, to_send, channel, mode, ids):
+    async def _send_units(self, to_send, channel, mode, ids, flush=True):
         self.logger.info(f'send_units_start_{mode} {ids} | Sending units to {channel.peer_id}')
         with timer(ids, 'pickle_units'):
-            data = pickle.dumps(to_send)
+            data = zlib.compress(pickle.dumps(to_send), level=consts.UNITS_ZLIB_LEVEL)
         self.logger.info(
             f'send_units_wait_{mode} {ids} | Sending {len(to_send)} units and {len(data)} bytes to {channel.peer_id}'
         )
-        await channel.write(data)
+        await channel.write(data, flush)
         self.logger.info(f'send_units_sent_{mode} {ids} | Sent {len(to_send)} units and {len(data)} bytes to {channel.peer_id}')
         self.logger.info(f'send_units_done_{mode} {ids} | Units sent {channel.peer_id}')
 
@@ -154,7 +165,7 @@ class Network:
         n_bytes = len(data)
         self.logger.info(f'receive_units_bytes_{mode} {ids} | Received {n_bytes} bytes from {channel.peer_id}')
         with timer(ids, 'unpickle_units'):
-            units_received = pickle.loads(data)
+            units_received = pickle.loads(zlib.decompress(data))
         self.logger.info(f'receive_units_done_{mode} {ids} | Received {n_bytes} bytes and {len(units_received)} units')
         return units_received
 
@@ -172,10 +183,16 @@ class Network:
         self.logger.info(f'add_received_{mode} {ids} | trying to add {len(units_received)} units from {peer_id} to poset')
         printable_unit_hashes = ''
 
+        poset = self.process.poset
+        poset_units = poset.units
+        add_unit_to_poset = self.process.add_unit_to_poset
         for unit in units_received:
-            dehash_parents(self.process.poset, unit)
             printable_unit_hashes += (' ' + unit.short_name())
-            if not self.process.add_unit_to_poset(unit):
+            # the hash does not depend on whether parents are already dehashed, so units we have are skipped right away
+            if unit.hash() in poset_units:
+                continue
+            dehash_parents(poset, unit)
+            if not add_unit_to_poset(unit):
                 self.logger.error(f'add_received_fail_{mode} {ids} | unit {unit.short_name()} from {peer_id} was rejected')
                 return False
 
@@ -184,9 +201,27 @@ class Network:
         )
         return True
 
-    def _verify_signatures_and_add_units(self, units_received, peer_id, mode, ids):
-        with timer(ids, 'verify_signatures'):
-            succesful = self._verify_signatures(units_received, mode, ids)
+    def _start_verifying_signatures(self, units_received, mode, ids):
+        # verifying signatures is CPU-heavy but does not touch the poset, hence it is run in the default executor so that
+        # the event loop can keep serving other syncs (and the rest of this one) in the meantime
+        # units already in the poset are skipped by _add_units, so there is no point in checking their signatures -- this is
+        # common when several syncs bring the same units; the poset only grows, so the filtering is done here, on the loop
+        poset_units = self.process.poset.units
+        units_to_verify = [unit for unit in units_received if unit.hash() not in poset_units]
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(None, self._verify_signatures, units_to_verify, mode, ids)
+
+    @staticmethod
+    def _cancel_verification(verification):
+        # called when a sync breaks before the result of verification is awaited; a cancelled future does not report
+        # the result or exception of the job, which may still be running in the executor
+        if verification is not None:
+            verification.cancel()
+
+    async def _verify_signatures_and_add_units(self, verification, units_received, peer_id, mode, ids):
+        # verification is the future returned by _start_verifying_signatures, adding units stays on the loop
+        with timer(ids, 'verify_signatures', disable_gc=False):
+            succesful = await verification
         if not succesful:
             self.logger.error(f'{mode}_invalid_sign {ids} | Got a unit from {peer_id} with invalid signature; aborting')
             return False
@@ -245,19 +280,27 @@ class Network:
             # step 3
             with timer(ids, 'prepare_units'):
                 to_send, to_request = units_to_send(self.process.poset, their_poset_info, their_requests)
-            await self._send_units(to_send, channel, 'sync', ids)
-            received_hashes = [U.hash() for U in units_received]
+            received_hashes = set(U.hash() for U in units_received)
             to_request = [[r for r in reqs if r not in received_hashes] for reqs in to_request]
-            await self._send_requests(to_request, channel, 'sync', ids)
+            # unless the sync is extended and the received units get replaced, verify them while sending ours
+            verification = None if any(to_request) else self._start_verifying_signatures(units_received, 'sync', ids)
+            try:
+                # units and requests are sent in one go, the latter flushes both
+                await self._send_units(to_send, channel, 'sync', ids, flush=False)
+                await self._send_requests(to_request, channel, 'sync', ids)
+            except BaseException:
+                self._cancel_verification(verification)
+                raise
 
             # step 4 (only if we requested something)
             if any(to_request):
                 self.logger.info(f'sync_extended {ids} | Sync with {peer_id} extended due to forks')
                 units_received = await self._receive_units(channel, 'sync', ids)
+                verification = self._start_verifying_signatures(units_received, 'sync', ids)
 
         await self.maybe_close(channel)
 
-        if self._verify_signatures_and_add_units(units_received, peer_id, 'sync', ids):
+        if await self._verify_signatures_and_add_units(verification, units_received, peer_id, 'sync', ids):
             self.logger.info(f'sync_succ {ids} | Syncing with {peer_id} successful')
             timer.write_summary(where=self.logger, groups=[ids])
         else:
@@ -287,24 +330,31 @@ class Network:
             self.logger.info(f'listener_establish {ids} | Connection established with {peer_id}')
 
             # step 2
-            await self._send_poset_info(channel, 'listener', ids)
+            # poset info, units and requests are sent in one go, the last write flushes them all
+            await self._send_poset_info(channel, 'listener', ids, flush=False)
             with timer(ids, 'prepare_units'):
                 to_send, to_request = units_to_send(self.process.poset, their_poset_info)
-            await self._send_units(to_send, channel, 'listener', ids)
+            await self._send_units(to_send, channel, 'listener', ids, flush=False)
             await self._send_requests(to_request, channel, 'listener', ids)
 
             # step 3
             units_received = await self._receive_units(channel, 'listener', ids)
-            their_requests = await self._receive_requests(channel, 'listener', ids)
-
-            # step 4 (only if they requested something)
-            if any(their_requests):
-                self.logger.info(f'listener_extended {ids} | Sync with {peer_id} extended due to forks')
-                with timer(ids, 'prepare_units'):
-                    to_send, _ = units_to_send(self.process.poset, their_poset_info, their_requests)
-                await self._send_units(to_send, channel, 'listener', ids)
-
-            if self._verify_signatures_and_add_units(units_received, peer_id, 'listener', ids):
+            # verify the received units while answering their requests
+            verification = self._start_verifying_signatures(units_received, 'listener', ids)
+            try:
+                their_requests = await self._receive_requests(channel, 'listener', ids)
+
+                # step 4 (only if they requested something)
+                if any(their_requests):
+                    self.logger.info(f'listener_extended {ids} | Sync with {peer_id} extended due to forks')
+                    with timer(ids, 'prepare_units'):
+                        to_send, _ = units_to_send(self.process.poset, their_poset_info, their_requests)
+                    await self._send_units(to_send, channel, 'listener', ids)
+            except BaseException:
+                self._cancel_verification(verification)
+                raise
+
+            if await self._verify_signatures_and_add_units(verification, units_received, peer_id, 'listener', ids):
                 self.logger.info(f'listener_succ {ids} | Syncing with {peer_id} successful')
                 timer.write_summary(where=self.logger, groups=[ids])
             else:
@@ -120,7 +120,10 @@ def tx_generator(committee_addresses, signing_keys, txps):
             starts = get_time()
 
         issuer_id = random.randrange(0, n_light_nodes)
-        receiver_id = random.choice([uid for uid in range(n_light_nodes) if uid != issuer_id])
+        # a random id other than issuer_id, without building the list of all the candidates
+        receiver_id = random.randrange(0, n_light_nodes - 1)
+        if receiver_id >= issuer_id:
+            receiver_id += 1
         amount = random.randrange(1, 100)
         tx = Tx(issuer_id, receiver_id, amount)
         data = pickle.dumps(tx)
@@ -14,6 +14,7 @@
 import asyncio
 import logging
 import multiprocessing
+import queue
 import random
 import os
 
@@ -147,13 +148,15 @@ class Process:
                     units_to_order = []
                     updated_unordered_units = []
                     for V in self.unordered_units:
-                        if self.poset.below(V, U_timing):
+                        # levels are monotone w.r.t. the poset order, so units above the timing level cannot be below U_timing
+                        # and we skip the more expensive below check for them
+                        if V.level <= U_timing.level and self.poset.below(V, U_timing):
                             units_to_order.append(V)
                         else:
                             updated_unordered_units.append(V)
 
                     ordered_units = self.poset.break_ties(units_to_order)
-                    self.linear_order += [W.hash() for W in ordered_units]
+                    self.linear_order.extend(W.hash() for W in ordered_units)
                     self.unordered_units = updated_unordered_units
 
                     printable_unit_hashes = ' '.join(W.short_name() for W in ordered_units)
@@ -171,7 +174,7 @@ class Process:
         :returns: boolean value: True if the unit was succesfully added or was already in the poset, False if the unit is not compliant
         '''
 
-        if U.hash() in self.poset.units.keys():
+        if U.hash() in self.poset.units:
             return True
 
         self.poset.prepare_unit(U)
@@ -279,9 +282,10 @@ class Process:
                 if new_unit.level == consts.LEVEL_LIMIT:
                     max_level_reached = True
 
-                if not txs_queue.empty():
-                    self.prepared_txs = txs_queue.get()
-                else:
+                # empty() is only approximate for multiprocessing queues, and a blocking get() would stall the event loop
+                try:
+                    self.prepared_txs = txs_queue.get_nowait()
+                except queue.Empty:
                     self.prepared_txs = []
             else:
                 self.logger.info(f'create_fail {self.process_id} | Failed to create a new unit')
@@ -311,14 +315,29 @@ class Process:
         await server_started.wait()
 
         sync_count = 0
-        syncing_tasks = []
+        # syncs in progress; finished ones remove themselves so that this does not grow with the number of syncs
+        syncing_tasks = set()
+
+        def sync_done(task, target_id):
+            syncing_tasks.discard(task)
+            # the task is not awaited anymore, so its exception has to be reported here
+            if not task.cancelled() and task.exception() is not None:
+                self.logger.error(f'sync_exception {self.process_id} | Sync with {target_id} failed with an exception',
+                                  exc_info=task.exception())
+
         while sync_count != consts.SYNCS_LIMIT and self.keep_syncing:
             sync_count += 1
             target_id = self.choose_process_to_sync_with()
-            syncing_tasks.append(asyncio.create_task(self.network.sync(target_id)))
+            # while the channel to target_id is in use by a previous sync, a new one would cancel itself, so we don't start it;
+            # the channel is released before the received units are verified and added, so a new sync can start meanwhile
+            if not self.network.sync_channels[target_id].in_use.locked():
+                task = asyncio.create_task(self.network.sync(target_id))
+                task.add_done_callback(lambda task, target_id=target_id: sync_done(task, target_id))
+                syncing_tasks.add(task)
             await asyncio.sleep(consts.SYNC_INIT_DELAY)
 
-        await asyncio.gather(*syncing_tasks)
+        # exceptions are already logged by sync_done
+        await asyncio.gather(*syncing_tasks, return_exceptions=True)
 
         # give some time for other processes to finish
         await asyncio.sleep(3*consts.SYNC_INIT_DELAY + 2)
@@ -30,13 +30,15 @@ def test_combine_signature():
     msg = 'there is no spoon'
     msg_hash = VK.hash_msg(msg)
 
-    # generate signature shares of all parties
-    shares = [SK.generate_share(msg_hash) for SK in SKs]
-    _shares = {i: shares[i] for i in sample(range(n_parties), threshold)}
+    # generate signature shares of a random subset of parties, the remaining shares would not be used
+    _shares = {i: SKs[i].generate_share(msg_hash) for i in sample(range(n_parties), threshold)}
 
     # check if all shares are valid
-    for i, share in _shares.items():
-        assert VK.verify_share(share, i, msg_hash)
+    assert VK.batch_verify_shares(_shares, msg_hash)
+
+    # a single invalid share makes the whole batch invalid
+    i, j = list(_shares)[:2]
+    assert not VK.batch_verify_shares({**_shares, i: _shares[j]}, msg_hash)
 
     # combine shares and check if the signature is valid
     signature = VK.combine_shares(_shares)
@@ -0,0 +1,64 @@
+'''
+    This is a Proof-of-Concept implementation of Aleph Zero consensus protocol.
+    Copyright (C) 2019 Aleph Zero Team
+    
+    This program is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+'''
+
+from collections import namedtuple
+
+from aleph.data_structures import UserDB
+
+# UserDB expects transactions carrying the index of the transaction among those issued by the issuer
+IndexedTx = namedtuple('IndexedTx', ['issuer', 'receiver', 'amount', 'index'])
+
+
+def test_first_time_receiver():
+    '''
+    Test whether a transaction to a user not present in the data base creates their account.
+    '''
+    userDB = UserDB([('alice', 100, -1)])
+    userDB.apply_transaction(IndexedTx('alice', 'bob', 30, 0))
+
+    assert userDB.account_balance('alice') == 70
+    assert userDB.account_balance('bob') == 30
+    assert userDB.last_transaction('alice') == 0
+    assert userDB.last_transaction('bob') == -1
+
+
+def test_overdraft_rejected():
+    '''
+    Test whether a transaction exceeding the balance of the issuer is rejected and leaves the data base untouched.
+    '''
+    userDB = UserDB([('alice', 100, 4), ('bob', 10, -1)])
+    tx = IndexedTx('alice', 'bob', 101, 5)
+
+    assert not userDB.check_transaction_correctness(tx)
+    userDB.apply_transaction(tx)
+
+    assert userDB.account_balance('alice') == 100
+    assert userDB.account_balance('bob') == 10
+    assert userDB.last_transaction('alice') == 4
+    assert userDB.last_transaction('bob') == -1
+
+
+def test_unknown_users():
+    '''
+    Test the balance and the last transaction of users not present in the data base.
+    '''
+    userDB = UserDB([('alice', 100, -1)])
+
+    assert userDB.account_balance('carol') == 0
+    assert userDB.last_transaction('carol') == -1
+    # queries do not add users to the data base
+    assert 'carol' not in userDB.index
+
+    # an unknown user can only issue an empty transaction
+    assert not userDB.check_transaction_correctness(IndexedTx('carol', 'alice', 1, 0))
+    assert userDB.check_transaction_correctness(IndexedTx('carol', 'alice', 0, 0))
@@ -15,3 +15,4 @@ from .dag import DAG
 from . import dag_utils
 from unittest import mock
 from .timer import timer
+from .event_loop import install_uvloop
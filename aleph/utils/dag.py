@@ -30,6 +30,8 @@ class DAG:
         self.n_processes = n_processes
         self.nodes = {}
         self.pids = {}
+        # the nodes created by every process, in the order they were added
+        self.nodes_by_process = [[] for _ in range(n_processes)]
         self.levels = {}
         self.prime_units_by_level = {}
         # a dictionary of the type node -> dict(), where dict contains additional info for this particular node
@@ -43,6 +45,7 @@ class DAG:
     def __len__(self): return len(self.nodes)
 
     def pid(self, node): return self.pids[node]
+    def process_nodes(self, pid): return self.nodes_by_process[pid]
     def parents(self, node): return self.nodes[node]
     def level(self, node): return self.levels[node]
     def height(self, node): return self.get_node_info(node, "height")
@@ -119,6 +122,7 @@ class DAG:
 
         self.pids[name] = pid
         self.nodes[name] = parents[:]
+        self.nodes_by_process[pid].append(name)
 
         if level_hint is None:
             # computing the level
@@ -263,7 +267,7 @@ class DAG:
         '''
         :returns: the set of maximal nodes in the dag, among created be process_id. If this process is not forking, it should be at most one node.
         '''
-        return self.compute_maximal_from_subset([U for U in self if self.pid(U) == process_id])
+        return self.compute_maximal_from_subset(self.process_nodes(process_id))
 
     def floor(self, U):
         '''
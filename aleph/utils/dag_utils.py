@@ -124,7 +124,7 @@ def generate_random_nonforking(n_processes, n_units, file_name = None):
         dag.add(generate_unit_name(0, process_id), process_id, [])
 
     for _ in range(n_units):
-        process_id = random.choice(range(n_processes))
+        process_id = random.randrange(n_processes)
         all_but_process_id = [i for i in range(n_processes) if i != process_id]
         parent_processes = [process_id] + random.sample(all_but_process_id , 1)
         unit_height = process_heights[process_id] + 1
@@ -158,8 +158,8 @@ def generate_random_forking(n_processes, n_units, n_forkers, file_name = None):
         node_heights[unit_name] = 0
 
     while len(dag) < n_processes + n_units:
-        process_id = random.choice(range(n_processes))
-        new_unit_first_parent = random.choice([U for U in dag if dag.pid(U) == process_id])
+        process_id = random.randrange(n_processes)
+        new_unit_first_parent = random.choice(dag.process_nodes(process_id))
         new_unit_parents = [new_unit_first_parent] + [random.choice(list(dag.nodes.keys()))]
         self_predecessor = check_new_unit_correctness(dag, process_id, new_unit_parents, forkers)
         if not self_predecessor:
@@ -194,11 +194,13 @@ def generate_random_compliant_unit(dag, n_processes, process_id = None):
     :returns: a pair (node, parents) -- the name of the new unit and its list of parents
     '''
     if process_id is None:
-        process_id = random.choice(range(n_processes))
+        process_id = random.randrange(n_processes)
     maximal_nodes = []
     for process_gen_id in range(n_processes):
         maximal_nodes.extend(dag.maximal_units_per_process(process_gen_id))
-    unit_pairs = list(product(maximal_nodes, repeat=2))
+    # the first parent has to be the self_predecessor, hence created by process_id, and the parents need to be created by
+    # distinct processes -- filtering the pairs upfront saves the graph searches of the checks below for pairs that cannot pass
+    unit_pairs = [(U1, U2) for U1, U2 in product(maximal_nodes, repeat=2) if dag.pid(U1) == process_id and dag.pid(U2) != process_id]
 
     random.shuffle(unit_pairs)
 
@@ -217,9 +219,6 @@ def generate_random_compliant_unit(dag, n_processes, process_id = None):
         if not check_forker_muting(dag, new_unit_parents):
             continue
 
-        if not check_distinct_parent_processes(dag, new_unit_parents):
-            continue
-
         return generate_unused_name(dag, process_id), new_unit_parents
 
     return None
@@ -254,8 +253,8 @@ def generate_random_violation(n_processes, n_correct_units, n_forkers, ensure, v
         assert it < 1000*(n_processes + n_correct_units), "The random process had troubles to terminate."
         assert len(dag) < 100*(n_processes + n_correct_units), "The random process had troubles to terminate."
 
-        process_id = random.choice(range(n_processes))
-        new_unit_first_parent = random.choice([U for U in dag if dag.pid(U) == process_id])
+        process_id = random.randrange(n_processes)
+        new_unit_first_parent = random.choice(dag.process_nodes(process_id))
         new_unit_parents = [new_unit_first_parent] + [random.choice(list(dag.nodes.keys()))]
         self_predecessor = dag.self_predecessor(process_id, new_unit_parents)
         if self_predecessor is None:
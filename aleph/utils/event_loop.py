@@ -0,0 +1,31 @@
+'''
+    This is a Proof-of-Concept implementation of Aleph Zero consensus protocol.
+    Copyright (C) 2019 Aleph Zero Team
+    
+    This program is free software: you can redistribute it and/or modify it under the terms of the GNU General Public License as published by the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+    
+    You should have received a copy of the GNU General Public License
+    along with this program. If not, see <http://www.gnu.org/licenses/>.
+'''
+
+import asyncio
+import logging
+
+import aleph.const as consts
+
+
+def install_uvloop():
+    '''
+    Make asyncio use uvloop's event loop, which is considerably faster than the default one. If uvloop is not installed
+    (it is a dependency, but is not available e.g. on Windows) the default loop is used and a warning is logged.
+    Has to be called before the event loop is created, i.e. before asyncio.run().
+    '''
+    try:
+        import uvloop
+    except ImportError:
+        logging.getLogger(consts.LOGGER_NAME).warning('install_uvloop | uvloop is not installed, using the default event loop')
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -80,25 +80,23 @@ def initialize_posets(n_processes, use_tcoin = False):
     crp = generate_crp(n_processes)
     return [Poset(n_processes, process_id, crp, use_tcoin = use_tcoin) for process_id in range(n_processes)]
 
-def distribute_unit(U, name, posets, name_to_unit, unit_to_name):
+def distribute_unit(U, name, posets, unit_to_name):
     '''
-    Add a unit to all the posets and update the mappings between units and names in dag.
+    Add a unit to all the posets and update the mappings from units to names in dag.
     :param unit U: the unit to be added to all the posets
     :param str name: name of the unit U in the dag
     :param list posets: the list of posets, one per process
-    :param list name_to_unit: a list of dicts {name_in_dag -> Unit}, one per process
     :param list unit_to_name: a list of dicts {Unit -> name_in_dag}, one per process
     '''
+    parent_hashes = [V.hash() for V in U.parents]
     for process_id in range(len(posets)):
         if process_id == U.creator_id:
             continue
-        parent_hashes = [V.hash() for V in U.parents]
         parents = [posets[process_id].units[V] for V in parent_hashes]
         U_new = Unit(U.creator_id, parents, U.transactions(), U.signature, U.coin_shares)
         posets[process_id].prepare_unit(U_new)
         assert posets[process_id].check_compliance(U_new), f'{U_new.creator_id} {U_new.level}'
         posets[process_id].add_unit(U_new)
-        name_to_unit[process_id][name] = U_new
         unit_to_name[process_id][U_new] = name
 
 def verify_nonforker_fails(dag, n_processes, creator_id):
@@ -132,7 +130,6 @@ def simulate_with_checks(
     dag = DAG(n_processes)
     posets = initialize_posets(n_processes, use_tcoin)
 
-    name_to_unit = [{} for process_id in range(n_processes)]
     unit_to_name = [{} for process_id in range(n_processes)]
 
     iter_count = 0
@@ -141,7 +138,7 @@ def simulate_with_checks(
     while len(dag) < n_units:
         iter_count += 1
         assert iter_count < n_units*5000, "Creating %d units seems to be taking too long." % n_units
-        creator_id = random.choice(range(n_processes))
+        creator_id = random.randrange(n_processes)
         res = generate_unit(dag, posets, creator_id, unit_to_name)
         if res is None:
             verify_fails(dag, n_processes, creator_id)
@@ -154,8 +151,7 @@ def simulate_with_checks(
         additional_args = post_prepare(U, posets[creator_id], dag, results, additional_args)
         assert posets[creator_id].check_compliance(U)
         posets[creator_id].add_unit(U)
-        name_to_unit[creator_id][name] = U
         unit_to_name[creator_id][U] = name
         # "send" it to other processes
-        distribute_unit(U, name, posets, name_to_unit, unit_to_name)
+        distribute_unit(U, name, posets, unit_to_name)
     return results
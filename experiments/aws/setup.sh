@@ -17,7 +17,7 @@ virtualenv --python=python3.7 p37
 source p37/bin/activate
 
 echo install from pip repo >> setup.log
-pip install setuptools pytest-xdist pynacl networkx numpy matplotlib joblib 
+pip install setuptools pytest-xdist pynacl networkx numpy matplotlib joblib uvloop
 
 echo install pbc >> setup.log
 wget https://crypto.stanford.edu/pbc/files/pbc-0.5.14.tar.gz
@@ -20,6 +20,7 @@ from optparse import OptionParser
 from aleph.crypto.keys import SigningKey, VerifyKey
 from aleph.data_structures import UserDB, Tx
 from aleph.process import Process
+from aleph.utils import install_uvloop
 
 
 def read_hosts_ip(hosts_path):
@@ -146,4 +147,5 @@ async def main():
 
 
 if __name__ == '__main__':
+    install_uvloop()
     asyncio.run(main())
@@ -27,7 +27,8 @@ setup(
         "psutil",
         "joblib",
         "pytest-xdist",
-        "tqdm"
+        "tqdm",
+        'uvloop; sys_platform != "win32"'
         ],
     license="",
     package_data={"aleph.test.data": ["simple.dag", "light_nodes_public_keys"]},
@@ -20,6 +20,7 @@ from aleph.crypto.keys import SigningKey, VerifyKey
 from aleph.data_structures import UserDB
 from aleph.network import tx_generator
 from aleph.process import Process
+from aleph.utils import install_uvloop
 import aleph.const as consts
 
 from byzantine_process import ByzantineProcess
@@ -205,6 +206,7 @@ def is_process_byzantine(process):
 
 
 if __name__ == '__main__':
+    install_uvloop()
     print('executing the ByzantineProcess test')
     asyncio.run(execute_test(process_builder(ByzantineProcess), 7000, 7500))
     print('success')
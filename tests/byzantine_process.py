@@ -138,7 +138,7 @@ class ByzantineProcess(Process):
     def add_unit_to_poset(self, U):
         logger = self._logger
         logger.debug(f'called at level {self._level}')
-        already_in_poset = U.hash() in self.poset.units.keys()
+        already_in_poset = U.hash() in self.poset.units
         if not Process.add_unit_to_poset(self, U):
             logger.debug("can't add a unit to the poset")
             return False
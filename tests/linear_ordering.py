@@ -21,16 +21,17 @@ from aleph.crypto.keys import SigningKey, VerifyKey
 from aleph.actions import create_unit
 
 
-def translate_parents_and_copy(U, hashes_to_units):
+def translate_parents_and_copy(U, all_hashes_to_units):
     '''
-    Takes a unit from the poset of a process A and the mapping hashes->Units for the poset for process B.
-    Returns a new unit (with correct references to corresponding parent units in B) to be added to B's poset.
-    The new unit has all the data in the floor/level/... fields erased.
+    Takes a unit from the poset of a process A and the mappings hashes->Units for the posets of other processes.
+    Returns a list of new units (with correct references to corresponding parent units in the respective posets), one per mapping,
+    to be added to these posets. The new units have all the data in the floor/level/... fields erased.
     '''
+    # the parts shared by all the copies are computed only once
     parent_hashes = [V.hash() for V in U.parents]
-    parents = [hashes_to_units[V] for V in parent_hashes]
-    U_new = Unit(U.creator_id, parents, U.transactions(), U.signature, U.coin_shares)
-    return U_new
+    txs = U.transactions()
+    return [Unit(U.creator_id, [hashes_to_units[V] for V in parent_hashes], txs, U.signature, U.coin_shares)
+            for hashes_to_units in all_hashes_to_units]
 
 
 n_processes = 16
@@ -51,24 +52,29 @@ for process_id in range(n_processes):
     processes.append(new_process)
 
 
+# all the posets are the same, so a process that failed to create a unit cannot succeed until a new unit is added
+infeasible_creators = set()
 for unit_no in range(n_units):
     while True:
-        creator_id = random.choice(range(n_processes))
+        candidates = [process_id for process_id in range(n_processes) if process_id not in infeasible_creators]
+        assert candidates, "No process can create a unit!"
+        creator_id = random.choice(candidates)
         process = processes[creator_id]
         new_unit = create_unit(process.poset, creator_id, [])
         if new_unit is None:
+            infeasible_creators.add(creator_id)
             continue
 
         process.poset.prepare_unit(new_unit)
         assert process.poset.check_compliance(new_unit), "A unit created by this process is not passing the compliance test!"
-        process.sign_unit(new_unit)
+        # units are passed between the posets directly, so signatures are never checked and there is no need to sign the unit
         process.add_unit_to_poset(new_unit)
 
-        for process_id in range(n_processes):
-            if process_id != creator_id:
-                hashes_to_units = processes[process_id].poset.units
-                U = translate_parents_and_copy(new_unit, hashes_to_units)
-                processes[process_id].add_unit_to_poset(U)
+        other_processes = [processes[process_id] for process_id in range(n_processes) if process_id != creator_id]
+        copies = translate_parents_and_copy(new_unit, [other.poset.units for other in other_processes])
+        for other, U in zip(other_processes, copies):
+            other.add_unit_to_poset(U)
+        infeasible_creators.clear()
         break
 
     if unit_no%50 == 0:
@@ -17,6 +17,7 @@ import socket
 from aleph.network import tx_source_gen
 from aleph.process import Process
 from aleph.crypto.keys import SigningKey, VerifyKey
+from aleph.utils import install_uvloop
 
 import aleph.const as consts
 
@@ -58,4 +59,5 @@ async def main():
 
 
 if __name__ == '__main__':
+    install_uvloop()
     asyncio.run(main())
@@ -22,6 +22,7 @@ from aleph.network import tx_generator
 from aleph.data_structures import Poset, UserDB
 from aleph.process import Process
 from aleph.crypto.keys import SigningKey, VerifyKey
+from aleph.utils import install_uvloop
 
 DISCOVERY_PORT = 49643
 
@@ -54,9 +55,7 @@ def make_database_response(account_priv_keys):
     return [(pubk.to_hex(), random.randrange(10000, 100000), -1) for pubk in account_public_keys]
 
 def put_message(writer, message):
-    writer.write(str(len(message)).encode())
-    writer.write(b'\n')
-    writer.write(message)
+    writer.write(len(message).to_bytes(4, 'big') + message)
 
 def make_discovery_server(priv_keys, account_priv_keys):
     response = []
@@ -80,8 +79,8 @@ def get_ip_candidates(ip_range):
     return set(ips)
 
 async def get_message(reader):
-    data = await reader.readuntil()
-    n_bytes = int(data[:-1])
+    header = await reader.readexactly(4)
+    n_bytes = int.from_bytes(header, 'big')
     data = await reader.readexactly(n_bytes)
     return pickle.loads(data)
 
@@ -174,4 +173,5 @@ async def run():
     await run_processes(client_map, priv_keys, database, account_priv_keys)
 
 if __name__ == '__main__':
+    install_uvloop()
     asyncio.run(run())